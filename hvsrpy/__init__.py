@@ -28,6 +28,7 @@ from .hvsr_spatial import HvsrSpatial, montecarlo_fn
 from .data_wrangler import read, read_single
 from .seismic_recording_3c import SeismicRecording3C
 from .timeseries import TimeSeries
+from .batched_timeseries import BatchedTimeSeries
 from .preprocessing import preprocess
 from .processing import process, rpsd
 from .settings import *
@@ -0,0 +1,219 @@
+# This file is part of hvsrpy, a Python package for horizontal-to-vertical
+# spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""BatchedTimeSeries class definition."""
+
+import logging
+
+import numpy as np
+from scipy.signal import butter, sosfiltfilt, detrend
+
+from .timeseries import TimeSeries, _tukey, _butterworth_btype_and_wn
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BatchedTimeSeries"]
+
+
+class BatchedTimeSeries():
+
+    def __init__(self, amplitude, dt_in_seconds):
+        """Initialize a ``BatchedTimeSeries`` object.
+
+        Parameters
+        ----------
+        amplitude : iterable
+            Amplitude of each time series at each time step, of shape
+            ``(n_windows, n_samples)``.
+        dt_in_seconds : float
+            Time step between samples in seconds.
+
+        Returns
+        -------
+        BatchedTimeSeries
+            Instantiated with amplitude and time step information.
+
+        Raises
+        ------
+        TypeError
+            If ``amplitude`` is not castable to ``ndarray``, refer to
+            error message(s) for specific details.
+
+        """
+        try:
+            self.amplitude = np.array(amplitude, dtype=np.double, order="C")
+        except ValueError:
+            msg = "``amplitude`` must be convertable to numeric ``ndarray``."
+            raise TypeError(msg)
+
+        if self.amplitude.ndim != 2:
+            msg = f"``amplitude`` must be 2-D, not {self.amplitude.ndim}-D."
+            raise TypeError(msg)
+
+        self.dt_in_seconds = float(dt_in_seconds)
+        logger.info(f"Created {self}.")
+
+    @property
+    def n_windows(self):
+        return self.amplitude.shape[0]
+
+    @property
+    def n_samples(self):
+        return self.amplitude.shape[1]
+
+    @property
+    def fs(self):
+        return 1/self.dt_in_seconds
+
+    @property
+    def fnyq(self):
+        return 0.5*self.fs
+
+    def time(self):
+        return np.arange(self.n_samples)*self.dt_in_seconds
+
+    def detrend(self, type="linear"):
+        """Remove trend from each window.
+
+        Parameters
+        ----------
+        type = {"constant", "linear"}, optional
+            Type of detrend, default is ``"linear"``, see
+            ``TimeSeries.detrend``.
+
+        Returns
+        -------
+        None
+            Performs inplace detrend on the ``amplitude`` attribute.
+
+        """
+        self.amplitude = np.require(self.amplitude, dtype=np.double,
+                                    requirements=["C", "W"])
+        self.amplitude = detrend(self.amplitude, axis=-1, type=type,
+                                 overwrite_data=True)
+
+    def window(self, type="tukey", width=0.1):
+        """Apply taper to each window.
+
+        Parameters
+        ----------
+        width : {0.-1.}
+            Fraction of each window to be tapered.
+        type : {"tukey"}, optional
+            Type of window, default is ``"tukey"``, see
+            ``TimeSeries.window``.
+
+        Returns
+        -------
+        None
+            Applies window to the ``amplitude`` attribute in-place.
+
+        """
+        if type == "tukey":
+            window = _tukey(self.n_samples, width)
+        else:
+            msg = f"Window type {type} not recognized, try ['tukey',]."
+            raise NotImplementedError(msg)
+
+        np.multiply(self.amplitude, window, out=self.amplitude)
+
+    def butterworth_filter(self, fcs_in_hz, order=5):
+        """Apply Butterworth filter to each window.
+
+        Parameters
+        ----------
+        fcs_in_hz : tuple
+            Butterworth filter's corner frequencies in Hz, see
+            ``TimeSeries.butterworth_filter``.
+        order : int, optional
+            Butterworth filter order, default is ``5``.
+
+        Returns
+        -------
+        None
+            Filters ``amplitude`` attribute in-place.
+
+        """
+        filter_design = _butterworth_btype_and_wn(fcs_in_hz)
+        if filter_design is None:
+            return None
+        btype, wn = filter_design
+
+        sos = butter(order, wn, btype, fs=self.fs, output='sos')
+        self.amplitude = sosfiltfilt(sos, self.amplitude, axis=-1)
+
+    @classmethod
+    def from_timeseries(cls, timeseries, window_length_in_seconds):
+        """Split ``TimeSeries`` into a ``BatchedTimeSeries``.
+
+        Parameters
+        ----------
+        timeseries : TimeSeries
+            ``TimeSeries`` to be split.
+        window_length_in_seconds : float
+            Duration of each split in seconds.
+
+        Returns
+        -------
+        BatchedTimeSeries
+            With one row per full-length window, see
+            ``TimeSeries.split_view`` for details.
+
+        """
+        windows = timeseries.split_view(window_length_in_seconds)
+        return cls(windows, timeseries.dt_in_seconds)
+
+    def to_timeseries(self):
+        """Convert to ``list`` of ``TimeSeries``, one per window."""
+        return [TimeSeries(amplitude, self.dt_in_seconds)
+                for amplitude in self.amplitude]
+
+    def is_similar(self, other):
+        """Check if ``other`` is similar to ``self``."""
+        if not isinstance(other, BatchedTimeSeries):
+            return False
+
+        if abs(other.dt_in_seconds - self.dt_in_seconds) > 1E-8:
+            return False
+
+        if other.amplitude.shape != self.amplitude.shape:
+            return False
+
+        return True
+
+    def __eq__(self, other):
+        """Check if ``other`` is equal to ``self``."""
+        if not self.is_similar(other):
+            return False
+
+        # identical arrays are equal, unless they contain NaN.
+        if (self.amplitude is other.amplitude
+                and not np.isnan(np.sum(self.amplitude))):
+            return True
+
+        if not np.allclose(self.amplitude, other.amplitude):
+            return False
+
+        return True
+
+    def __str__(self):
+        """Human-readable representation of ``BatchedTimeSeries``."""
+        return f"BatchedTimeSeries with {self.n_windows} windows of {self.n_samples} samples at {id(self)}."
+
+    def __repr__(self):
+        """Unambiguous representation of ``BatchedTimeSeries``."""
+        return f"BatchedTimeSeries(amplitude={self.amplitude}, dt_in_seconds={self.dt_in_seconds})"
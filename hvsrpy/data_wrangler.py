@@ -209,19 +209,15 @@ def _read_saf(fnames, obspy_read_kwargs=None, degrees_from_north=None):
                 msg += " CH1 must be vertical; CH2 & CH3 the horizontals."
                 raise ValueError(msg)
 
-    data = np.empty((npts_header, 3), dtype=np.float32)
-
-    idx = 0
-    for group in saf_row_exec.finditer(text):
-        channels = group.groups()
-        data[idx, 0] = float(channels[v_ch])
-        data[idx, 1] = float(channels[n_ch])
-        data[idx, 2] = float(channels[e_ch])
-        idx += 1
-
-    _check_npts(npts_header, idx)
+    first_row = saf_row_exec.search(text)
+    if first_row is None:
+        data = np.empty((0, 3), dtype=np.float32)
+    else:
+        data = np.loadtxt(io.StringIO(text[first_row.start():]),
+                          dtype=np.float32, ndmin=2)
+    _check_npts(npts_header, data.shape[0])
 
-    vt, ns, ew = data.T
+    vt, ns, ew = data[:, [v_ch, n_ch, e_ch]].T
 
     vt = TimeSeries(vt, dt_in_seconds=dt)
     ns = TimeSeries(ns, dt_in_seconds=dt)
@@ -276,17 +272,13 @@ def _read_minishark(fnames, obspy_read_kwargs=None, degrees_from_north=None):
     conversion = int(mshark_conversion_exec.search(text).groups()[0])
     gain = int(mshark_gain_exec.search(text).groups()[0])
 
-    data = np.empty((npts_header, 3), dtype=np.float32)
-
-    idx = 0
-    for group in mshark_row_exec.finditer(text):
-        vt, ns, ew = group.groups()
-        data[idx, 0] = float(vt)
-        data[idx, 1] = float(ns)
-        data[idx, 2] = float(ew)
-        idx += 1
-
-    _check_npts(npts_header, idx)
+    first_row = mshark_row_exec.search(text)
+    if first_row is None:
+        data = np.empty((0, 3), dtype=np.float32)
+    else:
+        data = np.loadtxt(io.StringIO(text[first_row.start():]),
+                          dtype=np.float32, comments="#", ndmin=2)
+    _check_npts(npts_header, data.shape[0])
 
     data /= gain
     data /= conversion
@@ -484,14 +476,9 @@ def _read_peer(fnames, obspy_read_kwargs=None, degrees_from_north=None):
         dt = float(peer_dt_exec.search(text).groups()[0])
         dts.append(dt)
 
-        amplitude = np.empty((npts_header))
-        idx = 0
-        for group in peer_sample_exec.finditer(text):
-            sample, = group.groups()
-            amplitude[idx] = sample
-            idx += 1
-
-        _check_npts(npts_header, idx)
+        samples = peer_sample_exec.findall(text)
+        _check_npts(npts_header, len(samples))
+        amplitude = np.array(samples, dtype=np.double)
 
         component_list.append(TimeSeries(amplitude, dt_in_seconds=dt))
 
@@ -18,18 +18,23 @@
 """HvsrSpatial class definition."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-from numpy.random import default_rng, PCG64, MT19937, BitGenerator
+from numpy.random import default_rng, PCG64, MT19937, BitGenerator, SeedSequence
+from numba import njit
 from scipy.spatial import Voronoi
+import shapely
 from shapely.geometry import MultiPoint, Point, Polygon
+from shapely.prepared import prep
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["montecarlo_fn", "HvsrVault"]
 
 
-def _statistics(values, weights):
+@njit(cache=True)
+def _statistics(values, weights):  # pragma: no cover
     """Calculate weighted mean and stddev.
 
     .. warning::
@@ -52,36 +57,142 @@ def _statistics(values, weights):
         Of the form ``(mean, stddev)`` where ``mean`` is the weighted
         mean and ``stddev`` the weighted standard deviation.
 
+    Notes
+    -----
+    Each row is reduced in a single pass using Welford's algorithm,
+    the rows are then merged using the weighted form of Chan et al.'s
+    parallel update.
+
     """
+    nrows, ncols = values.shape
     norm_weights = weights/np.sum(weights)
 
+    # Welford's one-pass mean and sum of squared deviations per row.
+    row_means = np.empty(nrows)
+    row_m2s = np.empty(nrows)
+    for i in range(nrows):
+        mean = 0.
+        m2 = 0.
+        for j in range(ncols):
+            delta = values[i, j] - mean
+            mean += delta/(j+1)
+            m2 += delta*(values[i, j] - mean)
+        row_means[i] = mean
+        row_m2s[i] = m2
+
     # Mean
-    mean = 0
-    for row_value, weight in zip(values, norm_weights):
-        mean += weight*np.sum(row_value)
-    mean /= len(row_value)
+    mean = 0.
+    for i in range(nrows):
+        mean += norm_weights[i]*row_means[i]
 
     # Stddev
-    numerator = 0
-    w2 = 0
-    for row_value, weight in zip(values, norm_weights):
-        diff = row_value - mean
-        numerator += weight*np.sum(diff*diff)
-        w2 += np.sum(weight*weight)
-    numerator /= len(row_value)
-    w2 /= len(row_value)
+    numerator = 0.
+    w2 = 0.
+    for i in range(nrows):
+        delta = row_means[i] - mean
+        numerator += norm_weights[i]*(row_m2s[i] + ncols*delta*delta)
+        w2 += norm_weights[i]*norm_weights[i]
+    numerator /= ncols
+    w2 /= ncols
     stddev = np.sqrt(numerator/(1-w2))
 
     return (mean, stddev)
 
 
+def _poly_area(region):
+    """Calculate area of a simple polygon using the shoelace formula.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    region : ndarray
+        Of shape ``(N, 2)`` containing the x, y coordinates of the
+        polygon's vertices in order. The ring need not be closed.
+
+    Returns
+    -------
+    float
+        Area of the polygon.
+
+    """
+    xs, ys = region[:, 0], region[:, 1]
+    return 0.5*abs(np.dot(xs, np.roll(ys, -1)) - np.dot(ys, np.roll(xs, -1)))
+
+
+@njit(cache=True)
+def _compute_far_points(ridge_points, ridge_vertices, vor_points,
+                        vor_vertices, center, radius):  # pragma: no cover
+    """Missing endpoints of the infinite ridges of a Voronoi diagram.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    ridge_points : ndarray
+        Of shape ``(R, 2)``, indices of the points between which each
+        Voronoi ridge lies.
+    ridge_vertices : ndarray
+        Of shape ``(R, 2)``, indices of the Voronoi vertices forming
+        each ridge, ``-1`` indicates a vertex at infinity.
+    vor_points : ndarray
+        Of shape ``(N, 2)``, coordinates of the input points.
+    vor_vertices : ndarray
+        Of shape ``(V, 2)``, coordinates of the Voronoi vertices.
+    center : ndarray
+        Of shape ``(2,)``, centroid of the input points.
+    radius : float
+        Distance to 'points at infinity'.
+
+    Returns
+    -------
+    ndarray
+        Of shape ``(R, 2)`` with the missing endpoint of each infinite
+        ridge, rows of finite ridges are ``nan``.
+
+    """
+    n_ridges = ridge_points.shape[0]
+    far_points = np.full((n_ridges, 2), np.nan)
+
+    for r in range(n_ridges):
+        v1, v2 = ridge_vertices[r, 0], ridge_vertices[r, 1]
+        if v2 < 0:
+            v1, v2 = v2, v1
+        if v1 >= 0:
+            continue
+
+        p1, p2 = ridge_points[r, 0], ridge_points[r, 1]
+
+        # tangent
+        tx = vor_points[p2, 0] - vor_points[p1, 0]
+        ty = vor_points[p2, 1] - vor_points[p1, 1]
+        norm = np.sqrt(tx*tx + ty*ty)
+        tx /= norm
+        ty /= norm
+
+        # normal
+        nx, ny = -ty, tx
+
+        mx = 0.5*(vor_points[p1, 0] + vor_points[p2, 0])
+        my = 0.5*(vor_points[p1, 1] + vor_points[p2, 1])
+        sign = np.sign((mx - center[0])*nx + (my - center[1])*ny)
+
+        far_points[r, 0] = vor_vertices[v2, 0] + sign*nx*radius
+        far_points[r, 1] = vor_vertices[v2, 1] + sign*ny*radius
+
+    return far_points
+
+
 def montecarlo_fn(generator_means,
                   generator_stddevs,
                   generator_weights,
                   distribution_generators="lognormal",
                   distribution_spatial="lognormal",
                   n_realizations=1000,
-                  rng=None
+                  rng=None,
+                  n_workers=1
                   ):
     """MonteCarlo simulation for spatial distribution of ``fn``.
 
@@ -111,6 +222,12 @@ def montecarlo_fn(generator_means,
     rng : None, optional
         User-defined random number generator (RNG), default is ``None``
         indicating ``default_rng()`` will be used.
+    n_workers : int, optional
+        Number of threads used to draw the realizations, default is
+        ``1``. If greater than ``1``, independent generators are
+        spawned from ``rng`` and each draws a subset of the
+        realizations; results are reproducible for a given seed and
+        ``n_workers``, but differ from those when ``n_workers=1``.
 
     Returns
     -------
@@ -129,25 +246,53 @@ def montecarlo_fn(generator_means,
         msg = f"dist_spatial = {distribution_spatial} not recognized."
         raise NotImplementedError(msg)
 
-    def realization(mean, stddev, n_realizations=n_realizations):
-        return rng.normal(mean, stddev, size=n_realizations)
+    if (isinstance(n_workers, bool)
+            or not isinstance(n_workers, (int, np.integer))
+            or n_workers < 1):
+        msg = f"n_workers must be a positive integer, not {n_workers}."
+        raise ValueError(msg)
 
-    realizations = np.empty((len(generator_means), n_realizations))
-    for r, (_mean, _stddev) in enumerate(zip(generator_means, generator_stddevs)):
-        realizations[r, :] = realization(_mean, _stddev)
+    generator_means = np.asarray(generator_means, dtype=np.float64)
+    generator_stddevs = np.asarray(generator_stddevs, dtype=np.float64)
+    generator_weights = np.asarray(generator_weights, dtype=np.float64)
 
-    if distribution_generators == "lognormal" and distribution_spatial == "normal":
-        realizations = np.exp(realizations)
-    elif distribution_generators == "normal" and distribution_spatial == "lognormal":
-        realizations = np.log(realizations)
+    shape = (generator_means.size, n_realizations)
+    if n_workers == 1:
+        realizations = rng.standard_normal(size=shape)
     else:
-        pass
-
-    fn_mean, fn_stddev = _statistics(realizations, generator_weights)
+        realizations = np.empty(shape)
+        seed_sequence = SeedSequence(rng.integers(2**63))
+        rngs = [default_rng(seed) for seed in seed_sequence.spawn(n_workers)]
+        bounds = np.linspace(0, n_realizations, n_workers+1).astype(int)
+
+        def fill(_rng, start, stop):
+            size = (shape[0], stop-start)
+            realizations[:, start:stop] = _rng.standard_normal(size=size)
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(fill, rngs, bounds[:-1], bounds[1:]))
+    np.multiply(realizations, generator_stddevs[:, np.newaxis],
+                out=realizations)
+    realizations += generator_means[:, np.newaxis]
+
+    # realizations are in the log domain if generators are lognormal.
+    log_domain = distribution_generators == "lognormal"
+
+    if log_domain and distribution_spatial == "normal":
+        np.exp(realizations, out=realizations)
+        log_domain = False
+
+    if distribution_spatial == "lognormal" and not log_domain:
+        fn_mean, fn_stddev = _statistics(np.log(realizations),
+                                         generator_weights)
+    else:
+        fn_mean, fn_stddev = _statistics(realizations, generator_weights)
 
     if distribution_spatial == "lognormal":
         fn_mean = np.exp(fn_mean)
-        realizations = np.exp(realizations)
+
+    if log_domain:
+        np.exp(realizations, out=realizations)
 
     return (fn_mean, fn_stddev, realizations)
 
@@ -237,10 +382,7 @@ class HvsrSpatial():  # pragma: no cover
 
         regions, indices = self._bounded_voronoi(mask)
 
-        areas = np.empty(len(regions))
-        for i, region in enumerate(regions):
-            closed_points = np.vstack((region, region[0]))
-            areas[i] = Polygon(closed_points).area
+        areas = np.array([_poly_area(region) for region in regions])
 
         return (areas/total_area, indices)
 
@@ -251,15 +393,20 @@ class HvsrSpatial():  # pragma: no cover
             Private methods are subject to change without warning.
 
         """
-        passing_points, passing_indices = [], []
-        for index, (x, y) in enumerate(self.coordinates):
-            p = Point(x, y)
-            if mask.contains(p):
-                passing_points.append([x, y])
-                passing_indices.append(index)
-            else:
-                logger.info(f"Discarding point ({x}, {y})")
-        return (np.array(passing_points), passing_indices)
+        xs, ys = self.coordinates.T
+        if hasattr(shapely, "contains_xy"):
+            inside = shapely.contains_xy(mask, xs, ys)
+        else:
+            # shapely<2.0 does not provide vectorized predicates.
+            prepared_mask = prep(mask)
+            inside = np.array([prepared_mask.contains(Point(x, y))
+                               for x, y in self.coordinates], dtype=bool)
+
+        for x, y in self.coordinates[~inside]:
+            logger.info(f"Discarding point ({x}, {y})")
+
+        passing_indices = np.flatnonzero(inside).tolist()
+        return (self.coordinates[inside], passing_indices)
 
     def bounded_voronoi(self, boundary):  # pragma: no cover
         """Vertices of bounded Voronoi region.
@@ -312,9 +459,7 @@ class HvsrSpatial():  # pragma: no cover
         # Define bounded Voronoi tesselations
         new_vertices = []
         for region in regions:
-            unique_points = vertices[region]
-            closed_points = np.vstack((unique_points, unique_points[0]))
-            polygon_before = Polygon(closed_points)
+            polygon_before = Polygon(vertices[region])
             polygon_after = polygon_before.intersection(mask)
             xs, ys = polygon_after.boundary.xy
             new_unique_points = np.array(list(zip(xs[:-1], ys[:-1])))
@@ -361,11 +506,26 @@ class HvsrSpatial():  # pragma: no cover
         if radius is None:
             radius = vor.points.ptp().max()
 
-        # Construct a map containing all ridges for a given point
-        all_ridges = {}
-        for (p1, p2), (v1, v2) in zip(vor.ridge_points, vor.ridge_vertices):
-            all_ridges.setdefault(p1, []).append((p2, v1, v2))
-            all_ridges.setdefault(p2, []).append((p1, v1, v2))
+        # Missing endpoint of each infinite ridge
+        ridge_points = np.ascontiguousarray(vor.ridge_points, dtype=np.int64)
+        ridge_vertices = np.asarray(vor.ridge_vertices, dtype=np.int64)
+        far_points = _compute_far_points(ridge_points, ridge_vertices,
+                                         vor.points, vor.vertices,
+                                         center, float(radius))
+        is_infinite = np.any(ridge_vertices < 0, axis=1)
+
+        # List each ridge once for both points it separates and sort by
+        # point, such that the ridges of a given point are contiguous.
+        ridge_owners = ridge_points.ravel()
+        ridge_ids = np.repeat(np.arange(len(ridge_points)), 2)
+
+        order = np.argsort(ridge_owners, kind="stable")
+        ridge_owners = ridge_owners[order]
+        ridge_ids = ridge_ids[order]
+
+        point_indices = np.arange(len(vor.points))
+        ridge_starts = np.searchsorted(ridge_owners, point_indices, side="left")
+        ridge_stops = np.searchsorted(ridge_owners, point_indices, side="right")
 
         # Reconstruct infinite regions
         for p1, region in enumerate(vor.point_region):
@@ -377,29 +537,16 @@ class HvsrSpatial():  # pragma: no cover
                 continue
 
             # reconstruct a non-finite region
-            ridges = all_ridges[p1]
+            start, stop = ridge_starts[p1], ridge_stops[p1]
             new_region = [v for v in vertices if v >= 0]
 
-            for p2, v1, v2 in ridges:
-                if v2 < 0:
-                    v1, v2 = v2, v1
-                if v1 >= 0:
+            for ridge_id in ridge_ids[start:stop]:
+                if not is_infinite[ridge_id]:
                     # finite ridge: already in the region
                     continue
 
-                # Compute the missing endpoint of an infinite ridge
-                # tangent
-                t = vor.points[p2] - vor.points[p1]
-                t /= np.linalg.norm(t)
-                # normal
-                n = np.array([-t[1], t[0]])
-
-                midpoint = vor.points[[p1, p2]].mean(axis=0)
-                direction = np.sign(np.dot(midpoint - center, n)) * n
-                far_point = vor.vertices[v2] + direction * radius
-
                 new_region.append(len(new_vertices))
-                new_vertices.append(far_point.tolist())
+                new_vertices.append(far_points[ridge_id].tolist())
 
             # sort region counterclockwise
             vs = np.asarray([new_vertices[v] for v in new_region])
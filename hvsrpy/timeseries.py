@@ -19,6 +19,7 @@
 
 import warnings
 import logging
+from functools import lru_cache
 
 import numpy as np
 from scipy.signal.windows import tukey
@@ -29,6 +30,52 @@ logger = logging.getLogger(__name__)
 __all__ = ["TimeSeries"]
 
 
+@lru_cache(maxsize=32)
+def _tukey(n_samples, alpha):
+    """Cached, read-only Tukey window.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    """
+    window = tukey(n_samples, alpha=alpha)
+    window.flags.writeable = False
+    return window
+
+
+def _butterworth_btype_and_wn(fcs_in_hz):
+    """Butterworth filter type and critical frequencies.
+
+    .. warning::
+        Private methods are subject to change without warning.
+
+    Parameters
+    ----------
+    fcs_in_hz : tuple
+        Butterworth filter's corner frequencies in Hz of the form
+        ``(fc_low, fc_high)``, ``None`` indicates a one-sided filter.
+
+    Returns
+    -------
+    tuple or None
+        Of the form ``(btype, wn)`` for use with
+        ``scipy.signal.butter``, or ``None`` if no corner frequencies
+        are provided, in which case a warning is issued.
+
+    """
+    fc_low, fc_high = fcs_in_hz
+    if fc_low is None and fc_high is not None:
+        return ("lowpass", fc_high)
+    elif fc_low is not None and fc_high is None:
+        return ("highpass", fc_low)
+    elif fc_low is not None and fc_high is not None:
+        return ("bandpass", [fc_low, fc_high])
+    else:
+        msg = "No corner frequencies provided; no filtering performed."
+        warnings.warn(msg)
+        return None
+
+
 class TimeSeries():
 
     def __init__(self, amplitude, dt_in_seconds):
@@ -80,6 +127,14 @@ class TimeSeries():
 
     # TODO (jpv): Consider adding absolute time information.
     def time(self):
+        """Time of each sample in seconds.
+
+        Returns
+        -------
+        ndarray
+            New time vector of size ``n_samples`` starting at zero.
+
+        """
         return np.arange(self.n_samples)*self.dt_in_seconds
 
     def trim(self, start_time, end_time):
@@ -106,9 +161,8 @@ class TimeSeries():
             record.
 
         """
-        current_time = self.time()
         start = 0
-        end = current_time[-1]
+        end = (self.n_samples-1)*self.dt_in_seconds
 
         if start_time < start:
             msg = "Illogical start_time for trim; "
@@ -127,8 +181,10 @@ class TimeSeries():
             msg += f"duration of the the time series of {end:.2f}"
             raise IndexError(msg)
 
-        start_index = np.argmin(np.absolute(current_time - start_time))
-        end_index = np.argmin(np.absolute(current_time - end_time))
+        # nearest sample, ties resolved to the earlier sample.
+        start_index = int(np.ceil(start_time/self.dt_in_seconds - 0.5))
+        end_index = min(int(np.ceil(end_time/self.dt_in_seconds - 0.5)),
+                        self.n_samples-1)
 
         self.amplitude = self.amplitude[start_index:end_index+1]
 
@@ -149,7 +205,10 @@ class TimeSeries():
             Performs inplace detrend on the ``amplitude`` attribute.
 
         """
-        self.amplitude = detrend(self.amplitude, type=type)
+        self.amplitude = np.require(self.amplitude, dtype=np.double,
+                                    requirements=["C", "W"])
+        self.amplitude = detrend(self.amplitude, type=type,
+                                 overwrite_data=True)
 
     # TODO (jpv): Consider adding the ability to overlap windows.
     def split(self, window_length_in_seconds):
@@ -190,6 +249,44 @@ class TimeSeries():
             start_idx = end_idx - 1
         return windows
 
+    def split_view(self, window_length_in_seconds):
+        """Split record into a two-dimensional view of windows.
+
+        Parameters
+        ----------
+        window_length_in_seconds : float
+            Duration of each split in seconds.
+
+        Returns
+        -------
+        ndarray
+            Read-only view into ``amplitude`` of shape
+            ``(n_windows, samples_per_window)``, one row per split.
+
+        Raises
+        ------
+        ValueError
+            If ``window_length_in_seconds`` is longer than the record.
+
+        Notes
+        -----
+            Windows share their bounding samples in the same manner as
+            ``split``, but no data is copied. Only full-length windows
+            are included, so unlike ``split`` a trailing window with
+            fewer than ``samples_per_window`` samples is never returned.
+
+        """
+        samples_per_window = int(window_length_in_seconds/self.dt_in_seconds) + 1
+
+        if samples_per_window > self.n_samples:
+            msg = f"Window length of {window_length_in_seconds} s is larger "
+            msg += f"than the record length of {(self.n_samples-1)*self.dt_in_seconds} s."
+            raise ValueError(msg)
+
+        windows = np.lib.stride_tricks.sliding_window_view(self.amplitude,
+                                                           samples_per_window)
+        return windows[::samples_per_window-1]
+
     def window(self, type="tukey", width=0.1):
         """Apply window to time series.
 
@@ -209,12 +306,12 @@ class TimeSeries():
 
         """
         if type == "tukey":
-            window = tukey(self.n_samples, alpha=width)
+            window = _tukey(self.n_samples, width)
         else:
             msg = f"Window type {type} not recognized, try ['tukey',]."
             raise NotImplementedError(msg)
 
-        self.amplitude *= window
+        np.multiply(self.amplitude, window, out=self.amplitude)
 
     def butterworth_filter(self, fcs_in_hz, order=5):
         """Apply Butterworth filter.
@@ -235,23 +332,14 @@ class TimeSeries():
             Filters ``amplitude`` attribute in-place.
 
         """
-        fc_low, fc_high = fcs_in_hz
-        if fc_low is None and fc_high is not None:
-            btype = "lowpass"
-            wn = fc_high
-        elif fc_low is not None and fc_high is None:
-            btype = "highpass"
-            wn = fc_low
-        elif fc_low is not None and fc_high is not None:
-            btype = "bandpass"
-            wn = [fc_low, fc_high]
-        else:
-            msg = "No corner frequencies provided; no filtering performed."
-            warnings.warn(msg)
+        filter_design = _butterworth_btype_and_wn(fcs_in_hz)
+        if filter_design is None:
             return None
+        btype, wn = filter_design
 
         sos = butter(order, wn, btype, fs=self.fs, output='sos')
-        self.amplitude = sosfiltfilt(sos, self.amplitude)
+        amplitude = np.ascontiguousarray(self.amplitude, dtype=np.double)
+        self.amplitude = sosfiltfilt(sos, amplitude)
 
     @classmethod
     def from_trace(cls, trace):
@@ -293,6 +381,11 @@ class TimeSeries():
         if not self.is_similar(other):
             return False
 
+        # identical arrays are equal, unless they contain NaN.
+        if (self.amplitude is other.amplitude
+                and not np.isnan(np.sum(self.amplitude))):
+            return True
+
         if not np.allclose(self.amplitude, other.amplitude):
             return False
 
@@ -84,7 +84,7 @@ def sta_lta_window_rejection(records,
             if npts_in_sta > n_samples:
                 msg = "sta_seconds must be shorter than record length;"
                 msg += f"sta_seconds is {sta_seconds} and "
-                msg += f"record length is {timeseries.time()[-1]}."
+                msg += f"record length is {(n_samples-1)*timeseries.dt_in_seconds}."
                 raise IndexError(msg)
             n_sta_in_window = int(timeseries.n_samples // npts_in_sta)
             short_timeseries = timeseries.amplitude[:npts_in_sta*n_sta_in_window]
@@ -96,7 +96,7 @@ def sta_lta_window_rejection(records,
             if npts_in_lta > n_samples:
                 msg = "lta_seconds must be shorter than record length;"
                 msg += f"lta_seconds is {lta_seconds} and "
-                msg += f"record length is {timeseries.time()[-1]}."
+                msg += f"record length is {(n_samples-1)*timeseries.dt_in_seconds}."
                 raise IndexError(msg)
             lta = np.mean(np.abs(short_timeseries[:npts_in_lta]))
 
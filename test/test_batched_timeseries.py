@@ -0,0 +1,113 @@
+# This file is part of hvsrpy, a Python package for
+# horizontal-to-vertical spectral ratio processing.
+# Copyright (C) 2019-2023 Joseph P. Vantassel (joseph.p.vantassel@gmail.com)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for BatchedTimeSeries object."""
+
+import logging
+
+import numpy as np
+
+import hvsrpy
+from testing_tools import unittest, TestCase
+
+logger = logging.getLogger("hvsrpy")
+logger.setLevel(level=logging.CRITICAL)
+
+
+class TestBatchedTimeSeries(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ex_dt = 0.01
+        cls.ex_time = np.arange(0, 10+cls.ex_dt/2, cls.ex_dt)
+        amplitude = np.sin(2*np.pi*10*cls.ex_time) + 0.1*cls.ex_time
+        cls.ex_tseries = hvsrpy.TimeSeries(amplitude, cls.ex_dt)
+
+    def test_batched_timeseries_init_with_bad_amplitude_non_numeric(self):
+        self.assertRaises(TypeError, hvsrpy.BatchedTimeSeries,
+                          [["a", "b"]], 0.1)
+
+    def test_batched_timeseries_init_with_bad_amplitude_non_2d(self):
+        self.assertRaises(TypeError, hvsrpy.BatchedTimeSeries,
+                          [1., 2., 3.], 0.1)
+
+    def test_batched_timeseries_from_timeseries(self):
+        batch = hvsrpy.BatchedTimeSeries.from_timeseries(self.ex_tseries, 1.0)
+        self.assertEqual(10, batch.n_windows)
+        self.assertEqual(101, batch.n_samples)
+        self.assertEqual(100., batch.fs)
+        self.assertEqual(50., batch.fnyq)
+        self.assertAlmostEqual(1., batch.time()[-1])
+
+        # batch owns a copy of the data.
+        batch.amplitude[0, 0] = 100.
+        self.assertNotEqual(100., self.ex_tseries.amplitude[0])
+
+    def test_batched_timeseries_matches_timeseries(self):
+        batch = hvsrpy.BatchedTimeSeries.from_timeseries(self.ex_tseries, 1.0)
+        windows = self.ex_tseries.split(1.0)
+
+        batch.detrend()
+        batch.window(width=0.2)
+        batch.butterworth_filter(fcs_in_hz=(1, 20))
+        for window in windows:
+            window.detrend()
+            window.window(width=0.2)
+            window.butterworth_filter(fcs_in_hz=(1, 20))
+
+        for expected, returned in zip(windows, batch.to_timeseries()):
+            self.assertArrayAlmostEqual(expected.amplitude,
+                                        returned.amplitude, places=10)
+
+    def test_batched_timeseries_window_with_bad_type(self):
+        batch = hvsrpy.BatchedTimeSeries.from_timeseries(self.ex_tseries, 1.0)
+        self.assertRaises(NotImplementedError, batch.window, type="cosine")
+
+    def test_batched_timeseries_filter_without_corners(self):
+        batch = hvsrpy.BatchedTimeSeries.from_timeseries(self.ex_tseries, 1.0)
+        with self.assertWarns(UserWarning):
+            batch.butterworth_filter(fcs_in_hz=(None, None))
+
+    def test_batched_timeseries_is_similar_and_equal(self):
+        a = hvsrpy.BatchedTimeSeries([[1., 2.], [3., 4.]], 1.)
+        b = hvsrpy.BatchedTimeSeries([[2., 3.], [4., 5.]], 1.)
+        c = hvsrpy.BatchedTimeSeries([[1., 2.], [3., 4.]], 2.)
+        d = hvsrpy.BatchedTimeSeries([[1., 2., 3.]], 1.)
+
+        self.assertTrue(a == a)
+        self.assertTrue(a.is_similar(b))
+        self.assertTrue(a != b)
+        self.assertFalse(a.is_similar(c))
+        self.assertFalse(a.is_similar(d))
+        self.assertFalse(a.is_similar(np.array([[1., 2.], [3., 4.]])))
+
+    def test_batched_timeseries_equal_on_close_and_nan_amplitudes(self):
+        a = hvsrpy.BatchedTimeSeries([[1., 2.], [3., 4.]], 1.)
+        b = hvsrpy.BatchedTimeSeries(a.amplitude + 1E-12, 1.)
+        self.assertTrue(a == b)
+
+        c = hvsrpy.BatchedTimeSeries([[1., np.nan], [3., 4.]], 1.)
+        self.assertFalse(c == c)
+
+    def test_batched_timeseries_str_and_repr(self):
+        batch = hvsrpy.BatchedTimeSeries.from_timeseries(self.ex_tseries, 1.0)
+        self.assertTrue(isinstance(batch.__str__(), str))
+        self.assertTrue(isinstance(batch.__repr__(), str))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 
 """Tests associated with hvsrpy's ability to import data."""
 
+import io
 import logging
 import warnings
 
@@ -54,11 +55,76 @@ class TestDataWrangler(TestCase):
         data = hvsrpy.data_wrangler.read_single(fname)
         self.assertTrue(isinstance(data, hvsrpy.SeismicRecording3C))
 
+    def test_read_saf_without_data_rows(self):
+        fname = self.input_path / "saf/mt_20211122_133110.saf"
+        with open(fname, "r") as f:
+            text = f.read()
+        header = text[:text.index("####")]
+        self.assertRaises(ValueError, hvsrpy.data_wrangler._read_saf,
+                          io.StringIO(header))
+
+    def test_read_saf_with_bom_and_indented_keys(self):
+        fname = self.input_path / "saf/mt_20211122_133110.saf"
+        with open(fname, "r") as f:
+            text = f.read()
+        expected = hvsrpy.data_wrangler._read_saf(io.StringIO(text))
+
+        # leading byte order mark.
+        text_with_bom = "\ufeff" + text
+        returned = hvsrpy.data_wrangler._read_saf(io.StringIO(text_with_bom))
+        self.assertEqual(expected.vt, returned.vt)
+
+        # indented header keys.
+        header, data = text.split("####", 1)
+        header = "\n".join(["  " + line for line in header.split("\n")])
+        text_indented = header + "####" + data
+        returned = hvsrpy.data_wrangler._read_saf(io.StringIO(text_indented))
+        self.assertEqual(expected.vt, returned.vt)
+
+    def test_read_saf_ignores_commented_keys(self):
+        fname = self.input_path / "saf/mt_20211122_133110.saf"
+        with open(fname, "r") as f:
+            text = f.read()
+        text = text.replace("NORTH_ROT = 0", "# NORTH_ROT = 5\nNORTH_ROT = 10")
+        data = hvsrpy.data_wrangler._read_saf(io.StringIO(text))
+        self.assertAlmostEqual(10., data.degrees_from_north)
+
     def test_read_single_on_minishark(self):
         fname = self.input_path / "minishark/0003_181115_0441.minishark"
         data = hvsrpy.data_wrangler.read_single(fname)
         self.assertTrue(isinstance(data, hvsrpy.SeismicRecording3C))
 
+    def test_read_minishark_with_bom(self):
+        fname = self.input_path / "minishark/0003_181115_0441.minishark"
+        with open(fname, "r") as f:
+            text = f.read()
+        expected = hvsrpy.data_wrangler._read_minishark(io.StringIO(text))
+
+        text_with_bom = "\ufeff" + text
+        returned = hvsrpy.data_wrangler._read_minishark(io.StringIO(text_with_bom))
+        self.assertEqual(expected.vt, returned.vt)
+
+    def test_read_minishark_with_indented_keys(self):
+        fname = self.input_path / "minishark/0003_181115_0441.minishark"
+        with open(fname, "r") as f:
+            text = f.read()
+        expected = hvsrpy.data_wrangler._read_minishark(io.StringIO(text))
+
+        lines = text.split("\n")
+        lines = ["  " + line if line.startswith("#") else line for line in lines]
+        text_indented = "\n".join(lines)
+        returned = hvsrpy.data_wrangler._read_minishark(io.StringIO(text_indented))
+        self.assertEqual(expected.vt, returned.vt)
+        self.assertEqual(expected.ns.dt_in_seconds, returned.ns.dt_in_seconds)
+
+    def test_read_minishark_without_data_rows(self):
+        fname = self.input_path / "minishark/0003_181115_0441.minishark"
+        with open(fname, "r") as f:
+            text = f.read()
+        header = text[:text.index("#Maximum amplitude")]
+        self.assertRaises(ValueError, hvsrpy.data_wrangler._read_minishark,
+                          io.StringIO(header))
+
     def test_read_single_on_sac_big_endian(self):
         fnames = []
         directory = self.input_path / "sac_big_endian"
@@ -41,6 +41,16 @@ class TestSpatial(TestCase):
         # Stddev
         expected = 1.776388346
         _, returned = spatial._statistics(values, weights)
+        self.assertAlmostEqual(expected, returned, places=6)
+
+    def test_poly_area(self):
+        # Unit square, open ring.
+        region = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float)
+        self.assertAlmostEqual(1., spatial._poly_area(region))
+
+        # Triangle, clockwise.
+        region = np.array([[0, 0], [0, 3], [4, 0]], dtype=float)
+        self.assertAlmostEqual(6., spatial._poly_area(region))
 
     def test_montecarlo_fn(self):
         means = np.array([0.2, 0.4, 0.6, 0.5])
@@ -118,6 +128,38 @@ class TestSpatial(TestCase):
                           spatial.montecarlo_fn, means, stds,
                           weights, distribution_spatial=dist_spatial)
 
+        # Bad n_workers
+        for n_workers in [0, 2.0, None, True]:
+            self.assertRaises(ValueError, spatial.montecarlo_fn, means, stds,
+                              weights, n_workers=n_workers)
+
+    def test_montecarlo_fn_with_multiple_workers(self):
+        means = np.array([0.2, 0.4, 0.6, 0.5])
+        stds = np.array([0.05, 0.07, 0.1, 0.01])
+        weights = np.array([1, 2, 4, 5])
+
+        returned = []
+        for _ in range(2):
+            rng = np.random.default_rng(1994)
+            returned.append(spatial.montecarlo_fn(means, stds, weights,
+                                                  distribution_generators="normal",
+                                                  distribution_spatial="normal",
+                                                  n_realizations=10000,
+                                                  rng=rng,
+                                                  n_workers=3))
+
+        # Reproducible
+        self.assertEqual(returned[0][0], returned[1][0])
+        self.assertArrayEqual(returned[0][2], returned[1][2])
+
+        # Realizations
+        _, _, realizations = returned[0]
+        self.assertTupleEqual((4, 10000), realizations.shape)
+        self.assertArrayAlmostEqual(means, np.mean(realizations, axis=1),
+                                    places=2)
+        self.assertArrayAlmostEqual(stds, np.std(realizations, axis=1),
+                                    places=2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -44,6 +44,23 @@ class TestTimeSeries(TestCase):
         self.assertEqual(min(time), 0)
         self.assertEqual(max(time), 5)
 
+    def test_timeseries_trim_at_half_sample_times(self):
+        # ties between samples resolve to the earlier sample.
+        tseries = hvsrpy.TimeSeries(np.arange(20), dt_in_seconds=0.5)
+        tseries.trim(0.75, 3.25)
+        self.assertArrayEqual(np.arange(1, 7, dtype=float), tseries.amplitude)
+
+        tseries = hvsrpy.TimeSeries(np.arange(20), dt_in_seconds=0.5)
+        tseries.trim(1.25, 2.75)
+        self.assertArrayEqual(np.arange(2, 6, dtype=float), tseries.amplitude)
+
+    def test_timeseries_time_returns_new_writeable_array(self):
+        tseries = hvsrpy.TimeSeries([1., 2., 3.], dt_in_seconds=0.5)
+        time = tseries.time()
+        time -= 1.
+        self.assertArrayEqual(np.array([-1., -0.5, 0.]), time)
+        self.assertArrayEqual(np.array([0., 0.5, 1.]), tseries.time())
+
     def test_timeseries_trim_fails_with_bad_start_time(self):
         tseries = hvsrpy.TimeSeries.from_timeseries(self.ex_tseries_sine)
         self.assertRaises(IndexError, tseries.trim, -1, 5)
@@ -62,6 +79,13 @@ class TestTimeSeries(TestCase):
         self.assertTrue(len(windows), 10)
         self.assertTrue(isinstance(windows[0], hvsrpy.TimeSeries))
 
+    def test_timeseries_split_view_to_one_second_windows(self):
+        tseries = hvsrpy.TimeSeries.from_timeseries(self.ex_tseries_sine)
+        windows = tseries.split_view(window_length_in_seconds=1.0)
+        self.assertTupleEqual((9, 1001), windows.shape)
+        self.assertArrayEqual(tseries.amplitude[1000:2001], windows[1])
+        self.assertEqual(windows[0, -1], windows[1, 0])
+
     def test_timeseries_split_where_window_length_is_too_large(self):
         tseries = hvsrpy.TimeSeries.from_timeseries(self.ex_tseries_sine)
         self.assertRaises(ValueError, tseries.split, 11.0)
@@ -120,6 +144,26 @@ class TestTimeSeries(TestCase):
         self.assertTrue(a != e)
         self.assertFalse(a.is_similar(e))
 
+    def test_timeseries_equal_on_same_close_and_nan_amplitudes(self):
+        a = hvsrpy.TimeSeries(amplitude=[1., 2., 3.], dt_in_seconds=1.)
+
+        # same amplitude array.
+        b = hvsrpy.TimeSeries(amplitude=[0., 0., 0.], dt_in_seconds=1.)
+        b.amplitude = a.amplitude
+        self.assertTrue(a == b)
+
+        # close, but not identical.
+        c = hvsrpy.TimeSeries(amplitude=a.amplitude + 1E-12, dt_in_seconds=1.)
+        self.assertTrue(a == c)
+
+        # not close.
+        d = hvsrpy.TimeSeries(amplitude=a.amplitude + 1E-3, dt_in_seconds=1.)
+        self.assertFalse(a == d)
+
+        # nan is not equal to itself.
+        e = hvsrpy.TimeSeries(amplitude=[1., np.nan, 3.], dt_in_seconds=1.)
+        self.assertFalse(e == e)
+
     def test_timeseries_str_and_repr(self):
         tseries = hvsrpy.TimeSeries.from_timeseries(self.ex_tseries_sine)
         self.assertTrue(isinstance(tseries.__str__(), str))